@@ -16,11 +16,14 @@ The application is accessible via the `/api` prefix for all included routers.
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 from src.api import contacts, utils, birstdays, auth, users
+from src.services.limiter import limiter
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.state.limiter = limiter
 origins = ["http://localhost:*"]
 app.add_middleware(
     CORSMiddleware,
@@ -50,8 +53,11 @@ async def rate_limit_handler(
     )
 
 
-app.include_router(utils.router, prefix="/api")
-app.include_router(contacts.router, prefix="/api")
-app.include_router(birstdays.router, prefix="/api")
-app.include_router(auth.router, prefix="/api")
-app.include_router(users.router, prefix="/api")
+for router in (
+    utils.router,
+    contacts.router,
+    birstdays.router,
+    auth.router,
+    users.router,
+):
+    app.include_router(router, prefix="/api")
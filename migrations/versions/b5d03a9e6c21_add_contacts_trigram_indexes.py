@@ -0,0 +1,33 @@
+"""add contacts trigram indexes
+
+Revision ID: b5d03a9e6c21
+Revises: 8c1f4e2a7b93
+Create Date: 2026-10-15 10:04:52.117349
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d03a9e6c21'
+down_revision: Union[str, None] = '8c1f4e2a7b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY can't run inside a transaction; build without locking the table
+    with op.get_context().autocommit_block():
+        op.create_index('ix_contacts_email_trgm', 'contacts', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_contacts_name_trgm', 'contacts', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_contacts_surname_trgm', 'contacts', ['surname'], unique=False, postgresql_using='gin', postgresql_ops={'surname': 'gin_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_surname_trgm', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_name_trgm', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_email_trgm', table_name='contacts', postgresql_concurrently=True)
@@ -2,23 +2,38 @@
 This module provides authentication-related endpoints for user registration and login.
 
 Endpoints:
-- POST /auth/register: Registers a new user in the system.
-- POST /auth/login: Authenticates a user and returns an access token.
+- POST /auth/register: Registers a new user in the system (no more than 3 requests per minute).
+- POST /auth/login: Authenticates a user and returns an access token
+    (no more than 10 requests per minute).
 """
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from src.schemas import UserCreate, Token, UserModel, RequestEmail
-from src.services.auth import create_access_token, Hash, get_email_from_token
+from src.services.auth import create_access_token, hasher, get_email_from_token
 from src.services.users import UserService
 from src.database.db import get_db
 from src.services.email import send_email
+from src.services.limiter import limiter
+
+# default Postgres names of the unique constraints on users
+UNIQUE_CONFLICTS = {
+    "users_email_key": "User with this email already exists",
+    "users_username_key": "User with this username already exists",
+}
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/register", response_model=UserModel, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    response_model=UserModel,
+    status_code=status.HTTP_201_CREATED,
+    description="No more than 3 requests per minute",
+)
+@limiter.limit("3/minute")
 async def register_user(
     user_data: UserCreate,
     background_tasks: BackgroundTasks,
@@ -31,21 +46,17 @@ async def register_user(
 
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User with this email already exists",
-        )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    user_data.password = hasher.get_password_hash(user_data.password)
+    try:
+        new_user = await user_service.create_user(user_data)
+    except IntegrityError as e:
+        # asyncpg's UniqueViolationError carries the violated constraint's name
+        constraint = getattr(e.orig.__cause__, "constraint_name", None)
+        if constraint not in UNIQUE_CONFLICTS:
+            raise
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User with this username already exists",
-        )
-    user_data.password = Hash().get_password_hash(user_data.password)
-    new_user = await user_service.create_user(user_data)
+            status_code=status.HTTP_409_CONFLICT, detail=UNIQUE_CONFLICTS[constraint]
+        ) from e
 
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
@@ -54,16 +65,21 @@ async def register_user(
     return new_user
 
 
-@router.post("/login", response_model=Token)
+@router.post(
+    "/login", response_model=Token, description="No more than 10 requests per minute"
+)
+@limiter.limit("10/minute")
 async def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    request: Request,  # pylint: disable=W0613
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_db),
 ):
     """
     Logs in a user by verifying their credentials and generating an access token.
     """
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    user = await user_service.get_user_for_login(form_data.username)
+    if not user or not hasher.verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Wrong credentials",
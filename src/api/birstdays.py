@@ -15,7 +15,7 @@ Functions:
 """
 
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
@@ -39,4 +39,4 @@ async def read_bistdays(
     """
     contact_service = BirthdayService(db)
     contacts = await contact_service.get_contacts(skip, limit, daygap, user)
-    return contacts
+    return Response(content=contacts, media_type="application/json")
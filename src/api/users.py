@@ -2,9 +2,6 @@
 This module provides /me endpoint for logged users.
 """
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
 from fastapi import APIRouter, Depends, Request, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,12 +10,12 @@ from src.services.auth import get_current_user
 
 from src.services.users import UserService
 from src.services.upload_file import UploadFileService
+from src.services.limiter import limiter
 from src.database.db import get_db
 from src.database.models import User
 from src.conf.config import settings
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get(
@@ -2,12 +2,16 @@
 System health checker module.
 """
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from src.database.db import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["utils"])
 
 
@@ -28,7 +32,7 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
             )
         return {"message": "Service is operated correctly"}
     except Exception as e:
-        print(e)
+        logger.exception("Health check failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
@@ -12,12 +12,25 @@ class Settings(BaseSettings):
     """
 
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_NULL_POOL: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    JWT_CACHE_TTL: int = 10
+    USER_CACHE_TTL: int = 60
+    USER_REDIS_CACHE_TTL: int = 300
+    USER_MISSING_CACHE_TTL: int = 30
+    BCRYPT_ROUNDS: int = 12
 
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    REDIS_MAX_CONNECTIONS: int = 50
 
     MAIL_USERNAME: EmailStr
     MAIL_PASSWORD: str
@@ -0,0 +1,18 @@
+"""
+Shared Redis client for the application.
+
+A single client (and its connection pool) is created per process and reused by
+every repository, instead of opening new connections on each request.
+"""
+
+import redis.asyncio as redis
+
+from src.conf.config import settings
+
+redis_client = redis.Redis(
+    connection_pool=redis.BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+    )
+)
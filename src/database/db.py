@@ -1,22 +1,38 @@
 import contextlib
+import logging
 
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from src.conf.config import settings
 
+logger = logging.getLogger(__name__)
+
+# share of the pool capacity in use above which checkouts are logged
+POOL_USAGE_WARNING = 0.8
+
 
 class DatabaseSessionManager:
-    def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+    def __init__(self, url: str, **engine_options):
+        self._engine: AsyncEngine | None = create_async_engine(url, **engine_options)
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        The engine the sessions are bound to.
+        """
+        return self._engine
+
     @contextlib.asynccontextmanager
     async def session(self):
         if self._session_maker is None:
@@ -31,12 +47,61 @@ class DatabaseSessionManager:
             await session.close()
 
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+if settings.DB_NULL_POOL:
+    # connections are pooled externally (e.g. PgBouncer in transaction mode)
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    echo=False,
+    **pool_options,
+)
+
+
+if not settings.DB_NULL_POOL:
+    POOL_CAPACITY = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+    @event.listens_for(sessionmanager.engine.sync_engine, "checkout")
+    def warn_on_pool_pressure(*_):
+        """
+        Log a warning when most of the pool's connections are checked out,
+        a sign that DB_POOL_SIZE / DB_MAX_OVERFLOW need tuning.
+        """
+        pool = sessionmanager.engine.pool
+        if pool.checkedout() > POOL_USAGE_WARNING * POOL_CAPACITY:
+            logger.warning(
+                "Database connection pool is nearly exhausted: %s", pool.status()
+            )
+
+
+def on_commit(session: AsyncSession, callback):
+    """
+    Register a coroutine function to run once the request's transaction has
+    been committed by `get_db`, e.g. to invalidate cached copies of changed rows.
+    """
+    session.info.setdefault("on_commit", []).append(callback)
 
 
 async def get_db():
     """
     Get a database session from the session manager.
+
+    One session is shared by every dependency of the request. Repositories only
+    flush their changes; the transaction is committed here once the endpoint
+    has returned, and rolled back if it raised.
     """
     async with sessionmanager.session() as session:
         yield session
+        await session.commit()
+        for callback in session.info.pop("on_commit", ()):
+            await callback()
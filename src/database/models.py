@@ -12,7 +12,7 @@ User:
 """
 
 from datetime import date
-from sqlalchemy import Integer, String, func, Column
+from sqlalchemy import Integer, SmallInteger, String, func, Column, Computed, Index
 from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import Date, DateTime, Boolean
@@ -34,11 +34,33 @@ class Contact(Base):
         email (str): The email address of the contact.
         phone_number (str): The phone number of the contact.
         birstday (date): The birth date of the contact.
+        birstday_doy (int): Day of the year of the birth date, generated by the database.
         notes (str): Additional notes about the contact.
         user (User): The user who owns the contact.
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_birstday_doy", "user_id", "birstday_doy"),
+        Index(
+            "ix_contacts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_surname_trgm",
+            "surname",
+            postgresql_using="gin",
+            postgresql_ops={"surname": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     user_id = Column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
@@ -50,6 +72,9 @@ class Contact(Base):
     birstday: Mapped[date] = mapped_column(
         "birstday", Date, default=func.now()  # pylint: disable=not-callable
     )
+    birstday_doy: Mapped[int] = mapped_column(
+        SmallInteger, Computed("EXTRACT(doy FROM birstday)::smallint", persisted=True)
+    )
     notes: Mapped[str] = mapped_column(String(500), nullable=True)
     user = relationship("User", backref="contacts")
 
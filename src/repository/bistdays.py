@@ -2,18 +2,19 @@
 DB operations for bistdays
 """
 
-import json
-from datetime import timedelta, datetime, date
+from datetime import timedelta, datetime
 from typing import List
-import redis.asyncio as redis
+import orjson
 
 from sqlalchemy import select
-from sqlalchemy.sql import extract
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.inspection import inspect
 
+from src.database.cache import redis_client
 from src.database.models import Contact, User
-from src.conf.config import settings
+from src.schemas import ContactResponse
+
+# Contact attributes exposed by ContactResponse, in its field order
+CONTACT_FIELDS = tuple(ContactResponse.model_fields)
 
 
 class BirthdayRepository:
@@ -23,72 +24,59 @@ class BirthdayRepository:
 
     def __init__(self, session: AsyncSession):
         self.db = session
-        self._redis = redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+        self._redis = redis_client
 
     def serialize_contact(self, contact) -> dict:
         """
-        Serialize a single Contact object into a dictionary, making all fields JSON-compatible.
+        Serialize a single Contact object into a dictionary of its response fields.
         """
-        mapper = inspect(contact)
-        serialized = {}
-
-        for column in mapper.attrs:
-            value = getattr(contact, column.key)
-            if isinstance(value, datetime):
-                serialized[column.key] = value.isoformat()
-            elif isinstance(value, date):
-                serialized[column.key] = value.isoformat()
-            elif isinstance(value, object):
-                serialized[column.key] = str(value)
-            else:
-                serialized[column.key] = value
-
-        return serialized
+        return {field: getattr(contact, field) for field in CONTACT_FIELDS}
+
+    async def _fetch_contacts(self, stmt) -> List[dict]:
+        """
+        Run the contacts query and serialize the rows.
+        """
+        contacts = await self.db.scalars(stmt)
+        return [self.serialize_contact(contact) for contact in contacts]
 
     async def get_contacts(
         self, skip: int, limit: int, daygap: int, user: User
-    ) -> List[Contact]:
+    ) -> bytes:
         """
-        Retrieve contacts, skip and limit are used for pagination
+        Retrieve contacts, nearest birthday first; skip and limit paginate.
+
+        The page is returned as the JSON document sent to the client, so a cache
+        hit is passed through without decoding. The database is only queried when
+        the page is not in the cache.
         """
 
         today = datetime.now()
         start_day = today.timetuple().tm_yday
         end_day = (today + timedelta(days=daygap)).timetuple().tm_yday
-        redis_key = f"{user.id}-{skip}-{limit}-{daygap}"
-
-        cached_contacts = await self._redis.lrange(redis_key, 0, -1)
-        if cached_contacts:
-            return [json.loads(contact.decode("utf-8")) for contact in cached_contacts]
+        redis_key = f"birstdays:{user.id}-{skip}-{limit}-{daygap}"
 
         if end_day < start_day:
-            stmt = (
-                select(Contact)
-                .filter_by(user=user)
-                .filter(
-                    (extract("doy", Contact.birstday) >= start_day)
-                    | (extract("doy", Contact.birstday) <= end_day)
-                )
-                .offset(skip)
-                .limit(limit)
+            in_range = (Contact.birstday_doy >= start_day) | (
+                Contact.birstday_doy <= end_day
             )
         else:
-            stmt = (
-                select(Contact)
-                .filter_by(user=user)
-                .filter(extract("doy", Contact.birstday).between(start_day, end_day))
-                .offset(skip)
-                .limit(limit)
-            )
-
-        contacts_result = await self.db.execute(stmt)
-        contacts = contacts_result.scalars().all()
-
-        for contact in contacts:
-            await self._redis.rpush(
-                redis_key, json.dumps(self.serialize_contact(contact))
-            )
-
-        await self._redis.expire(redis_key, 3600)
-
-        return [self.serialize_contact(contact) for contact in contacts]
+            in_range = Contact.birstday_doy.between(start_day, end_day)
+        # days until the birthday, so the nearest ones come first
+        days_left = (Contact.birstday_doy - start_day + 366) % 366
+        stmt = (
+            select(Contact)
+            .filter_by(user=user)
+            .filter(in_range)
+            .order_by(days_left, Contact.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        cached_contacts = await self._redis.get(redis_key)
+        if cached_contacts is not None:
+            return cached_contacts
+
+        serialized_contacts = orjson.dumps(await self._fetch_contacts(stmt))
+        await self._redis.set(redis_key, serialized_contacts, ex=3600)
+
+        return serialized_contacts
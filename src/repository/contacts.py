@@ -2,9 +2,9 @@
 DB operations for contacts
 """
 
-from typing import List
+from typing import Iterable, List
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
@@ -39,17 +39,40 @@ class ContactRepository:
             )
         else:
             stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
-        contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        contacts = await self.db.scalars(stmt)
+        return list(contacts.all())
 
     async def get_contact_by_id(self, contact_id: int, user: User) -> Contact | None:
         """
         Return a contact by id, needed for create, update and delete operations
         """
-        stmt = select(Contact).filter_by(id=contact_id, user=user)
+        user_id = user.id
+        stmt = lambda_stmt(
+            lambda: select(Contact).where(
+                Contact.id == contact_id, Contact.user_id == user_id
+            )
+        )
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: Iterable[int], user: User) -> dict[int, Contact]:
+        """
+        Retrieve several contacts of the given user in a single query.
+
+        Args:
+            ids (Iterable[int]): The IDs of the contacts to retrieve.
+            user (User): The user to whom the contacts belong.
+
+        Returns:
+            dict[int, Contact]: The found contacts keyed by their ID.
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+        stmt = select(Contact).where(Contact.id.in_(ids), Contact.user_id == user.id)
+        result = await self.db.execute(stmt)
+        return {contact.id: contact for contact in result.scalars().all()}
+
     async def create_contact(self, body: ContactModel, user: User) -> Contact:
         """
         Create a new contact for the given user.
@@ -62,16 +85,16 @@ class ContactRepository:
             Contact: The newly created contact with the given information.
 
         Raises:
-            SQLAlchemyError: If there is an error committing the contact to the database.
+            SQLAlchemyError: If there is an error writing the contact to the database.
         """
         contact = Contact(
             **body.model_dump(exclude_unset=True),
             user=user,
         )
         self.db.add(contact)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(contact)
-        return await self.get_contact_by_id(contact.id, user)
+        return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
         """
@@ -84,11 +107,13 @@ class ContactRepository:
         Returns:
             Contact | None: The removed contact if it existed, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
-        return contact
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def update_contact(
         self, contact_id: int, body: ContactUpdate, user: User
@@ -102,10 +127,11 @@ class ContactRepository:
         Returns:
             Contact | None: The updated contact if found, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            for key, value in body.dict(exclude_unset=True).items():
-                setattr(contact, key, value)
-            await self.db.commit()
-            await self.db.refresh(contact)
-        return contact
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**body.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
@@ -6,13 +6,19 @@ Classes:
 
 """
 
-from sqlalchemy import select
+from typing import Iterable
+
+from sqlalchemy import lambda_stmt, select
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from src.database.models import User
 from src.schemas import UserCreate
 
+# columns that dump_user never copies into a cache snapshot
+UNCACHED_COLUMNS = frozenset({"hashed_password"})
+
 
 class UserRepository:
     """
@@ -27,8 +33,14 @@ class UserRepository:
         Retrieves a user by their username.
     async def get_user_by_email(self, email: str) -> User | None
         Retrieves a user by their email.
+    async def get_users_by_ids(self, ids: Iterable[int]) -> dict[int, User]
+        Retrieves several users by their IDs in a single query.
     async def create_user(self, body: UserCreate, avatar: str = None) -> User
         Creates a new user with the given details and optional avatar.
+    def dump_user(user: User) -> dict
+        Takes a snapshot of the user's column values for caching.
+    async def restore_user(self, data: dict) -> User
+        Attaches a cached user snapshot to the session without querying the database.
     """
 
     def __init__(self, session: AsyncSession):
@@ -44,7 +56,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -58,7 +70,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(username=username)
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -72,10 +84,27 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
+    async def get_users_by_ids(self, ids: Iterable[int]) -> dict[int, User]:
+        """
+        Retrieve several users by their IDs in a single query.
+
+        Args:
+            ids (Iterable[int]): The IDs of the users to retrieve.
+
+        Returns:
+            dict[int, User]: The found users keyed by their ID.
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+        stmt = select(User).where(User.id.in_(ids))
+        result = await self.db.execute(stmt)
+        return {user.id: user for user in result.scalars().all()}
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Create a new user in the database.
@@ -93,22 +122,23 @@ class UserRepository:
             avatar=avatar
         )
         self.db.add(user)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(user)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> User:
         """
         Mark the user's email as confirmed.
         Args:
             email (str): The email address of the user to confirm.
         Returns:
-            None
+            User: The confirmed user object.
         """
 
         user = await self.get_user_by_email(email)
         user.confirmed = True
-        await self.db.commit()
+        await self.db.flush()
+        return user
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
@@ -124,6 +154,38 @@ class UserRepository:
 
         user = await self.get_user_by_email(email)
         user.avatar = url
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
         return user
+
+    @staticmethod
+    def dump_user(user: User) -> dict:
+        """
+        Take a snapshot of the user's column values, suitable for caching.
+        The password hash is left out so it never ends up in a cache.
+
+        Args:
+            user (User): The user object to snapshot.
+
+        Returns:
+            dict: The column values of the user keyed by attribute name.
+        """
+        return {
+            column.key: getattr(user, column.key)
+            for column in User.__table__.columns
+            if column.key not in UNCACHED_COLUMNS
+        }
+
+    async def restore_user(self, data: dict) -> User:
+        """
+        Attach a user snapshot taken by `dump_user` to the session without
+        querying the database.
+
+        Args:
+            data (dict): The column values of the user.
+
+        Returns:
+            User: The user object bound to the current session.
+        """
+        user = User(**data)
+        make_transient_to_detached(user)
+        return await self.db.merge(user, load=False)
@@ -5,6 +5,9 @@ This module provides authentication services including password hashing,
 Classes:
     Hash: Provides methods to hash and verify passwords using bcrypt.
 
+Attributes:
+    hasher (Hash): Shared Hash instance used by the API.
+
 Functions:
     create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
 
@@ -18,11 +21,13 @@ Functions:
 
 """
 
+import hashlib
 from typing import Optional
 from datetime import datetime, timedelta, UTC
+import bcrypt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 
@@ -36,7 +41,7 @@ class Hash:
     Hash class provides methods to hash and verify passwords using bcrypt.
 
     Attributes:
-        pwd_context (CryptContext): The context for password hashing and verification.
+        rounds (int): The bcrypt cost factor used for new hashes.
 
     Methods:
         verify_password(plain_password, hashed_password):
@@ -46,7 +51,7 @@ class Hash:
             Hashes a plain password and returns the hashed password.
     """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    rounds = settings.BCRYPT_ROUNDS
 
     def verify_password(self, plain_password, hashed_password):
         """
@@ -59,11 +64,11 @@ class Hash:
         Returns:
             bool: True if the plain password matches the hashed password, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
     def get_password_hash(self, password: str):
         """
-        Hashes the provided password using the password context.
+        Hashes the provided password with a freshly generated bcrypt salt.
 
         Args:
             password (str): The plain text password to be hashed.
@@ -71,11 +76,19 @@ class Hash:
         Returns:
             str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(
+            password.encode(), bcrypt.gensalt(rounds=self.rounds)
+        ).decode()
+
+
+hasher = Hash()
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# verified tokens, keyed by the SHA-256 of the token: digest -> (username, exp)
+_jwt_cache = TTLCache(maxsize=10_000, ttl=settings.JWT_CACHE_TTL)
+
 
 # define a function to generate a new access token
 async def create_access_token(data: dict, expires_delta: Optional[int] = None):
@@ -108,6 +121,9 @@ async def get_current_user(
     """
     Retrieve the current user based on the provided JWT token.
 
+    Verified tokens are cached for a few seconds (``JWT_CACHE_TTL``) so repeated
+    requests skip signature verification; only the token hash is kept in memory.
+
     Args:
         token (str): The JWT token provided by the user.
         db (Session): The database session dependency.
@@ -124,18 +140,24 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        # Decode JWT
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload["sub"]
-        if username is None:
-            raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception from e
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None and cached[1] > datetime.now(UTC).timestamp():
+        username = cached[0]
+    else:
+        try:
+            # Decode JWT
+            payload = jwt.decode(
+                token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+            )
+            username = payload["sub"]
+            if username is None:
+                raise credentials_exception
+        except JWTError as e:
+            raise credentials_exception from e
+        _jwt_cache[key] = (username, payload.get("exp", 0))
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    user = await user_service.get_cached_user_by_username(username)
     if user is None:
         raise credentials_exception
     return user
@@ -21,16 +21,18 @@ class BirthdayService:
         __init__(db: AsyncSession):
             Initializes the BirthdayService with a database session.
 
-        get_contacts(skip: int, limit: int, daygap: int, user: User) -> List[Contact]:
+        get_contacts(skip: int, limit: int, daygap: int, user: User) -> bytes:
 
 
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: AsyncSession):
         self.repository = BirthdayRepository(db)
 
     async def get_contacts(self, skip: int, limit: int, daygap: int, user: UserModel):
         """
-        Retrieve a list of contacts with upcoming birthdays.
+        Retrieve a list of contacts with upcoming birthdays, already encoded as JSON.
         """
         return await self.repository.get_contacts(skip, limit, daygap, user)
@@ -7,6 +7,9 @@
 - **get_contact(contact_id: int, user: User):**
     Retrieves a contact by its ID for a specific user.
 
+- **get_contacts_by_ids(ids: Iterable[int], user: User):**
+    Retrieves several contacts of a specific user by their IDs in one query.
+
 - **update_contact(contact_id: int, body: ContactModel, user: User):**
 
 - **remove_contact(contact_id: int, user: User):**
@@ -23,6 +26,8 @@ Retrieves a contact by its ID for a specific user.
 
 """
 
+from typing import Iterable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.repository.contacts import ContactRepository
 from src.schemas import ContactModel, UserModel
@@ -40,11 +45,15 @@ class ContactService:
 
         get_contact(contact_id: int, user: User):
 
+        get_contacts_by_ids(ids: Iterable[int], user: User):
+
         update_contact(contact_id: int, body: ContactModel, user: User):
 
         remove_contact(contact_id: int, user: User):
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: AsyncSession):
         self.repository = ContactRepository(db)
 
@@ -91,6 +100,20 @@ class ContactService:
         """
         return await self.repository.get_contact_by_id(contact_id, user)
 
+    async def get_contacts_by_ids(self, ids: Iterable[int], user: UserModel):
+        """
+        Retrieve several contacts of a specific user by their IDs in one query.
+
+        Args:
+            ids (Iterable[int]): The IDs of the contacts to retrieve.
+            user (User): The user to whom the contacts belong.
+
+        Returns:
+            dict[int, Contact]: The found contacts keyed by their ID; missing
+                or foreign IDs are left out.
+        """
+        return await self.repository.get_by_ids(ids, user)
+
     async def update_contact(
         self, contact_id: int, body: ContactModel, user: UserModel
     ):
@@ -2,6 +2,7 @@
 Email sender module to send emails to users.
 """
 
+import logging
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
@@ -11,6 +12,8 @@ from pydantic import EmailStr
 from src.services.auth import create_email_token
 from src.conf.config import settings
 
+logger = logging.getLogger(__name__)
+
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
@@ -45,5 +48,5 @@ async def send_email(email: EmailStr, username: str, host: str):
 
         fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
-    except ConnectionErrors as err:
-        print(err)
+    except ConnectionErrors:
+        logger.warning("Failed to send confirmation email to %s", email, exc_info=True)
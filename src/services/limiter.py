@@ -0,0 +1,11 @@
+"""
+Shared rate limiter for the API routers.
+
+The limiter is registered on the application in `main.py`, routers import it
+to decorate endpoints with per-client request limits.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+limiter = Limiter(key_func=get_remote_address)
@@ -8,23 +8,90 @@ Methods:
         Creates a new user with the provided information and generates an avatar.
     get_user_by_id(user_id: int):
         Retrieves a user by their unique identifier.
+    get_users_by_ids(ids: Iterable[int]):
+        Retrieves several users by their identifiers in a single query.
     get_user_by_username(username: str):
         Retrieves a user by their username.
+    get_user_for_login(username: str):
+        Retrieves a user with their password hash straight from the database.
     get_user_by_email(email: str):
         Retrieves a user by their email address.
     confirmed_email(email: str):
         Checks if the email is confirmed.
     update_avatar_url(email: str, url: str):
         Asynchronously updates the avatar URL for a user identified by their email.
+    get_cached_user_by_username(username: str):
+        Retrieves a user by their username through the short-lived user cache.
 
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import hashlib
+import logging
+from datetime import datetime
+from typing import Iterable
 
-from libgravatar import Gravatar
+import orjson
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.cache import redis_client
+from src.database.db import on_commit
+from src.database.models import User
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
+from src.conf.config import settings
+
+logger = logging.getLogger(__name__)
+
+# snapshots of recently authenticated users: username -> column values
+user_cache = TTLCache(maxsize=5_000, ttl=settings.USER_CACHE_TTL)
+# emails recently looked up without a matching user
+missing_email_cache = TTLCache(maxsize=10_000, ttl=settings.USER_MISSING_CACHE_TTL)
+
+# Redis value marking a lookup that found no user
+MISSING_USER = b"__NONE__"
+
+
+def _gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar image URL for an email address.
+    Args:
+        email (str): The email address of the user.
+    Returns:
+        str: The Gravatar image URL derived from the MD5 hash of the normalized email.
+    """
+    email_hash = hashlib.md5(email.strip().lower().encode("utf-8")).hexdigest()
+    return f"https://www.gravatar.com/avatar/{email_hash}"
+
+
+def _user_cache_keys(user: User) -> tuple[str, str, str]:
+    """
+    Build the Redis keys under which a user snapshot is cached.
+    Args:
+        user (User): The user object.
+    Returns:
+        tuple[str, str, str]: The keys by id, username and email.
+    """
+    return (
+        f"user:id:{user.id}",
+        f"user:uname:{user.username}",
+        f"user:email:{user.email}",
+    )
+
+
+def _load_user_snapshot(raw: bytes) -> dict:
+    """
+    Decode a user snapshot stored in Redis.
+    Args:
+        raw (bytes): The JSON encoded snapshot.
+    Returns:
+        dict: The column values of the user.
+    """
+    data = orjson.loads(raw)
+    if data.get("created_at") is not None:
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return data
 
 
 class UserService:
@@ -38,15 +105,22 @@ class UserService:
             Creates a new user with the provided information and generates an avatar.
         get_user_by_id(user_id: int):
             Retrieves a user by their unique identifier.
+        get_users_by_ids(ids: Iterable[int]):
+            Retrieves several users by their identifiers in a single query.
         get_user_by_username(username: str):
             Retrieves a user by their username.
+        get_user_for_login(username: str):
+            Retrieves a user with their password hash straight from the database.
         get_user_by_email(email: str):
             Retrieves a user by their email address.
         confirmed_email(email: str):
             Checks if the email is confirmed.
         update_avatar_url(email: str, url: str):
+        get_cached_user_by_username(username: str):
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: AsyncSession):
         self.repository = UserRepository(db)
 
@@ -57,17 +131,12 @@ class UserService:
             body (UserCreate): The user information required to create a new user.
         Returns:
             User: The created user object with the provided information and generated avatar.
-        Raises:
-            Exception: If there is an error generating the avatar.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:  # pylint: disable=broad-except
-            print(e)
+        avatar = _gravatar_url(body.email)
 
-        return await self.repository.create_user(body, avatar)
+        user = await self.repository.create_user(body, avatar)
+        self._invalidate(user)
+        return user
 
     async def get_user_by_id(self, user_id: int):
         """
@@ -80,7 +149,20 @@ class UserService:
             UserNotFoundError: If no user is found with the given user_id.
         """
 
-        return await self.repository.get_user_by_id(user_id)
+        return await self._get_through_cache(
+            f"user:id:{user_id}", self.repository.get_user_by_id, user_id
+        )
+
+    async def get_users_by_ids(self, ids: Iterable[int]):
+        """
+        Retrieve several users by their unique identifiers in a single query.
+        Args:
+            ids (Iterable[int]): The unique identifiers of the users.
+        Returns:
+            dict[int, User]: The found users keyed by their ID.
+        """
+
+        return await self.repository.get_users_by_ids(ids)
 
     async def get_user_by_username(self, username: str):
         """
@@ -91,8 +173,42 @@ class UserService:
             User: The user object corresponding to the given username.
         """
 
+        return await self._get_through_cache(
+            f"user:uname:{username}", self.repository.get_user_by_username, username
+        )
+
+    async def get_user_for_login(self, username: str):
+        """
+        Retrieve a user by their username straight from the database. The user
+        caches do not keep password hashes, so logins always read the row.
+        Args:
+            username (str): The username of the user to retrieve.
+        Returns:
+            User: The user object with its password hash,
+                or None if no user is found.
+        """
+
         return await self.repository.get_user_by_username(username)
 
+    async def get_cached_user_by_username(self, username: str):
+        """
+        Retrieve a user by their username, serving repeated lookups from a short-lived
+        in-process cache (``USER_CACHE_TTL``) instead of the database.
+        Args:
+            username (str): The username of the user to retrieve.
+        Returns:
+            User: The user object corresponding to the given username,
+                or None if no user is found.
+        """
+
+        data = user_cache.get(username)
+        if data is not None:
+            return await self.repository.restore_user(data)
+        user = await self.get_user_by_username(username)
+        if user is not None:
+            user_cache[username] = self.repository.dump_user(user)
+        return user
+
     async def get_user_by_email(self, email: str):
         """
         Retrieve a user by their email address.
@@ -103,7 +219,17 @@ class UserService:
                 or None if no user is found.
         """
 
-        return await self.repository.get_user_by_email(email)
+        if email in missing_email_cache:
+            return None
+        user = await self._get_through_cache(
+            f"user:email:{email}",
+            self.repository.get_user_by_email,
+            email,
+            cache_missing=True,
+        )
+        if user is None:
+            missing_email_cache[email] = True
+        return user
 
     async def confirmed_email(self, email: str):
         """
@@ -111,10 +237,12 @@ class UserService:
         Args:
             email (str): The email address to check.
         Returns:
-            bool: True if the email is confirmed, False otherwise.
+            User: The confirmed user object.
         """
 
-        return await self.repository.confirmed_email(email)
+        user = await self.repository.confirmed_email(email)
+        self._invalidate(user)
+        return user
 
     async def update_avatar_url(self, email: str, url: str):
         """
@@ -126,4 +254,66 @@ class UserService:
             The result of the repository's update_avatar_url method.
         """
 
-        return await self.repository.update_avatar_url(email, url)
+        user = await self.repository.update_avatar_url(email, url)
+        self._invalidate(user)
+        return user
+
+    async def _get_through_cache(
+        self, key: str, fetch, *args, cache_missing: bool = False
+    ):
+        """
+        Read a user from Redis, falling back to the database on a miss and
+        caching the result for ``USER_REDIS_CACHE_TTL`` seconds.
+        Args:
+            key (str): The Redis key of the user snapshot.
+            fetch: The repository getter to call on a cache miss.
+            *args: The arguments passed to the getter.
+            cache_missing (bool): Also remember for ``USER_MISSING_CACHE_TTL``
+                seconds that no user was found.
+        Returns:
+            User: The user object, or None if no user is found.
+        """
+
+        try:
+            cached = await redis_client.get(key)
+        except RedisError:
+            logger.warning("Failed to read %s from Redis", key, exc_info=True)
+            cached = None
+        if cached == MISSING_USER:
+            return None
+        if cached is not None:
+            return await self.repository.restore_user(_load_user_snapshot(cached))
+        user = await fetch(*args)
+        try:
+            if user is not None:
+                await redis_client.set(
+                    key,
+                    orjson.dumps(self.repository.dump_user(user)),
+                    ex=settings.USER_REDIS_CACHE_TTL,
+                )
+            elif cache_missing:
+                await redis_client.set(
+                    key, MISSING_USER, ex=settings.USER_MISSING_CACHE_TTL
+                )
+        except RedisError:
+            logger.warning("Failed to write %s to Redis", key, exc_info=True)
+        return user
+
+    def _invalidate(self, user: User):
+        """
+        Drop every cached copy of the user once its changes are committed.
+        Args:
+            user (User): The user object that was changed.
+        """
+
+        username, email, keys = user.username, user.email, _user_cache_keys(user)
+
+        async def drop_cached_user():
+            user_cache.pop(username, None)
+            missing_email_cache.pop(email, None)
+            try:
+                await redis_client.delete(*keys)
+            except RedisError:
+                logger.warning("Failed to drop %s from Redis", keys, exc_info=True)
+
+        on_commit(self.repository.db, drop_cached_user)